@@ -3,11 +3,12 @@
 #   and is concatenated. The function passes anything before a ';' into the lexer to get back the tokens. These
 #   tokens are subsequently passed to the Parser class.
 
-# The lexer simply moves the input string and tries to match against the regex for each token type in the
-#   'patterns' list. If there is a char/word that can't be matched then the user has typed in something invalid.
+# The lexer simply scans the input string with a single regex scanner built from the regex for each token type in
+#   the 'patterns' list. If there is a char/word that can't be matched then the user has typed in something invalid.
 #   The lexer function gives an error indicating where the erroneous char/word is. Otherwise a list of tuples
 #   is returned. The tuple holds the token type and value, this is especially helpful for the id and literal types
-#   which don't have pre-defined values. This list is passed onto the Parser class via the input function.
+#   which don't have pre-defined values. This list is passed onto the Parser class via the input function, so the
+#   whole statement has been lexed (and any invalid token found) before anything is run.
 
 # Next the Parser class is used to check that each statement follows its own 'statement rules'. This is achieved
 #   by comparing the current lexer token type with the expected lexer token type. If they don't match then an
@@ -18,107 +19,167 @@
 #   use/update/replace etc. If not then an appropriate error message is given, and the user can re-try their input.
 
 import re
+import string
 
 # A list of tuples to hold the lexer token types and their relevant regex
 patterns = [
-    ('APPEND', r'\bappend\b'),
-    ('EXIT', r'\bexit\b'),
-    ('LIST', r'\blist\b'),
-    ('PRINTLENGTH', r'\bprintlength\b'),
-    ('PRINTWORDS', r'\bprintwords\b'),
-    ('PRINTWORDCOUNT', r'\bprintwordcount\b'),
-    ('PRINT', r'\bprint\b'),
-    ('REVERSE', r'\breverse\b'),
-    ('SET', r'\bset\b'),
-    ('CONSTANT', r'TAB|SPACE|NEWLINE'),
     ('END', r';'),
     ('PLUS', r'\+'),
-    ('ID', r'[a-zA-Z][a-zA-Z0-9]*'),
+    ('ID', r'[a-zA-Z][a-zA-Z0-9]*'),        # also matches keywords and constants, these are found in '_KEYWORDS'
     ('LITERAL', r'"(?:\\.|[^"\\])*"'),      # handles special chars, " within a literal require a '\' first
     ('WHITESPACE', r'\s+|\\t+|\\n+'),       # used so that lexer knows about whitespace chars
 ]
 
+# Dictionary of the fixed words and their lexer token type. Any other word matched by the 'ID' regex is an id
+_KEYWORDS = {
+    'append': 'APPEND',
+    'exit': 'EXIT',
+    'list': 'LIST',
+    'print': 'PRINT',
+    'printlength': 'PRINTLENGTH',
+    'printwords': 'PRINTWORDS',
+    'printwordcount': 'PRINTWORDCOUNT',
+    'reverse': 'REVERSE',
+    'set': 'SET',
+    'TAB': 'CONSTANT',
+    'SPACE': 'CONSTANT',
+    'NEWLINE': 'CONSTANT',
+}
+
+# The lexer token types that are a 'value' in an expression
+_VALUE_TYPES = frozenset(('ID', 'CONSTANT', 'LITERAL'))
+
+# The lexer token types that start one of the 4 print statements
+_PRINT_TYPES = frozenset(('PRINT', 'PRINTLENGTH', 'PRINTWORDS', 'PRINTWORDCOUNT'))
+
+# Dictionary of the constants and the whitespace char they evaluate to
+_CONST_VAL = {'SPACE': ' ', 'TAB': '\t', 'NEWLINE': '\n'}
+
+# Regex for words. Words may start and end with a '. Words contain at least 1 alphanumeric char, and may have a - or
+# a ' between chars
+_WORD_RE = re.compile(r"'?[a-zA-Z0-9]+(?:['-][a-zA-Z0-9]+)*'?")
+
+# Translation table that deletes letters, digits and whitespace. If nothing is left of a string then it is only plain
+# words separated by whitespace, so it can be split without the word regex
+_PLAIN_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + string.whitespace)
+
+# Regex for the chars that change the state of the input reader: a '\' escapes the next char in a literal, a " starts
+# or ends a literal, and a ';' ends a statement
+_STATE_CHARS_RE = re.compile(r'[";\\]')
+
+
+# Helper to make the scanner callback for a token type. The callback turns a matched string into a token-value tuple
+def _make_callback(token_type):
+    # Find whitespaces but don't add to the list -> less work later on
+    if token_type == 'WHITESPACE':
+        return None
+
+    # Strip the double quotes from the literal, and remove escape characters before inner quotes
+    if token_type == 'LITERAL':
+        return lambda scanner, value: (token_type, value[1:-1].replace('\\"', '"'))
+
+    # Words are looked up to see if they are a keyword or constant, if not then they are an id
+    if token_type == 'ID':
+        return lambda scanner, value: (_KEYWORDS.get(value, 'ID'), value)
+
+    return lambda scanner, value: (token_type, value)
+
+
+# Scanner that combines every pattern into one regex, tried in the same order as 'patterns'. Each match is passed to
+# its callback to create the token
+_SCANNER = re.Scanner([(pattern, _make_callback(token_type)) for token_type, pattern in patterns])
+
 
 # Lexer function. Returns a list of token-value tuples based on the patterns matched, or gives error if invalid token
 def lexer(input_string):
-    tokens = []
-    pos = 0
-
-    # loop that moves through the input string trying to match lexical tokens/patterns
-    while pos < len(input_string):
-        lex_match = None
-
-        # loop through each tuple in 'patterns' to see if input matches the current pattern
-        for token_type, pattern in patterns:
-            regex = re.compile(pattern)
-            lex_match = regex.match(input_string, pos)
-
-            # For 'LITERAL' tokens use the first capturing group, all other patterns use the entire matched string
-            if lex_match:
-                value = lex_match.group(0)
-
-                # Find whitespaces but don't add to the list -> less work later on
-                if token_type != 'WHITESPACE':
-                    if token_type == 'LITERAL':
-                        # Strip the double quotes from the literal
-                        value = value[1:-1]
-                        # Remove escape characters before inner quotes
-                        value = re.sub(r'\\"', '"', value)
-                    tokens.append((token_type, value))
-
-                pos = lex_match.end()
-                break
-
-        # If user enters something not part of Lexer language give error message showing error location
-        if not lex_match:
-            raise ValueError(f"Unexpected token entered at position {pos}: '{input_string[pos]}'. Try input again")
+    tokens, remainder = _SCANNER.scan(input_string)
+
+    # If user enters something not part of Lexer language give error message showing error location
+    if remainder:
+        pos = len(input_string) - len(remainder)
+        raise ValueError(f"Unexpected token entered at position {pos}: '{remainder[0]}'. Try input again")
     return tokens
 
 
+# Function to split a string into its words (based off assignment specs). REMOVES NON-WORD PUNCTUATION.
+def _split_words(value):
+    # str.split() is much faster than the regex, but only gives the same words if there is no punctuation
+    if not value.translate(_PLAIN_CHARS):
+        return value.split()
+    return _WORD_RE.findall(value)
+
+
+# Function to find where statements end in a line of input. Jumps straight between the chars that matter, a " that
+# isn't escaped by a '\' moves in/out of a literal, and a ';' outside a literal ends a statement. Returns the position
+# after each of these ';', and whether the line finishes within a literal
+def _find_statement_ends(line, in_literal):
+    ends = []
+    escaped_pos = -1        # position of the char after a '\' within a literal, this char is part of the literal
+
+    for match in _STATE_CHARS_RE.finditer(line):
+        pos = match.start()
+        char = match.group()
+
+        if pos == escaped_pos:
+            continue
+        if char == '\\':
+            if in_literal:
+                escaped_pos = pos + 1
+        elif char == '"':
+            in_literal = not in_literal
+        elif not in_literal:
+            ends.append(pos + 1)
+
+    return ends, in_literal
+
+
 # Function to get user input. Statements (input with a ';' not in quotes) are found and analysed one at a time in
 # the lexer function.
 def get_user_input():
-    concat_input = ""
+    pending = []            # parts of the current statement from earlier lines that haven't reached a ';' yet
+    in_literal = False      # carried between lines, so that a literal can be spread over multiple lines
 
     # Getting input. Allow users to enter input over multiple lines.
     while True:
-        user_input = input()
-        concat_input += user_input + '\n'
+        user_input = input() + '\n'
+        start = 0
 
-        # if current line has odd number of "s then are within a literal, otherwise are outside
-        if concat_input.count('"') % 2 == 1:
-            in_literal = True
-        else:
-            in_literal = False
+        # Only the new line is scanned, so each char of input is only looked at once
+        end_positions, in_literal = _find_statement_ends(user_input, in_literal)
 
-        # If not in a string literal, look for ';' to signify end of statement
-        if not in_literal:
-            end_matches = [match.end() for match in re.finditer(r';(?=(?:[^"]*"[^"]*")*[^"]*$)', concat_input)]
+        # For each semicolon found, process the statement
+        for end_pos in end_positions:
+            pending.append(user_input[start:end_pos])
+            input_to_process = ''.join(pending)         # stores the statement up to and including the ';'
+            pending = []
+            start = end_pos                             # updates so the above won't be analyzed again
 
-            # For each semicolon found, process the statement
-            for end_pos in end_matches:
-                input_to_process = concat_input[:end_pos]   # stores the string before the ';'
-                concat_input = concat_input[end_pos + 1:]   # updates so the above won't be analyzed again
+            # Each statement is passed to the lexer, resulting in a list of tokens, or an invalid token error
+            try:
+                matches = lexer(input_to_process)
+                parser = Parser(matches)
+                parser.parse()
 
-                # Each statement is passed to the lexer, resulting in a list of tokens, or an invalid token error
-                try:
-                    matches = lexer(input_to_process)
-                    parser = Parser(matches)
-                    parser.parse()
+            # if lexer finds invalid token then will raise a ValueError which is then printed here.
+            except ValueError as e:
+                print("ERROR:", e)
 
-                # if lexer finds invalid token then will raise a ValueError which is then printed here.
-                except ValueError as e:
-                    print("ERROR:", e)
+        # Anything after the last ';' is the start of the next statement. If that is only whitespace (eg the '\n')
+        # and not within a literal it is dropped, so a statement starting on the next line doesn't include it in its
+        # error positions. Whitespace before a statement later on the same line is kept and counted
+        remainder = user_input[start:]
+        if in_literal or not remainder.isspace():
+            pending.append(remainder)
 
 
 # The Parser class is used to check the syntax of statements to ensure they match rules of the language
 class Parser:
 
-    # Constructor. Stores lexer tokens, variables track the current tuple and index of next tuple
+    # Constructor. Stores an iterator over the statement's list of lexer tokens, variable tracks the current tuple.
+    # Expressions are evaluated and statements run while parsing, so the list must hold every token of the statement
     def __init__(self, lex_tokens):
-        self.tokens = lex_tokens
+        self.lex_tokens = iter(lex_tokens)
         self.currToken = None
-        self.currIndex = 0
 
     # Method checking if current token matches the expected token. If not, give error indicating what token should be
     def valid_match(self, expected_token):
@@ -127,14 +188,9 @@ class Parser:
         else:
             print(f'Expected {expected_token} but got a token {self.currToken[0]} with value "{self.currToken[1]}"')
 
-    # Method to move onto the next token in the list
+    # Method to move onto the next token from the lexer, None once there are no more tokens
     def next_token(self):
-        # check for out of bounds error, then index ino the tokens list to get the next tuple
-        if self.currIndex < len(self.tokens):
-            self.currToken = self.tokens[self.currIndex]
-            self.currIndex += 1
-        else:
-            self.currToken = None
+        self.currToken = next(self.lex_tokens, None)
 
     # Method to start the parsing process
     def parse(self):
@@ -143,164 +199,147 @@ class Parser:
     # Method to identify statement type, and check against its syntax rules
     def statement(self):
 
-        # Get the first tuple (constructor sets currToken to None) and extract token type. Create "Interpreter" object
+        # Get the first tuple (constructor sets currToken to None) and extract token type. The statement type's method
+        # is found in 'statement_types', if the token type isn't in there then the statement is invalid
         self.next_token()
         token = self.currToken[0]
-        interpreter = Interpreter(self.tokens)
-
-        # APPEND and SET both follow order:      append/set -> id -> expression -> end
-        if token == "APPEND" or token == "SET":
-            self.next_token()
-            self.valid_match('ID')
-            expr_start = self.currIndex - 1     # holds position of expression start
+        Parser.statement_types.get(token, Parser.invalid_statement)(self)
 
-            # After 'ID' should be a valid expression. If not give an error, otherwise should be followed by 'END'
-            if self.expression() is False:
-                print("ERROR: Instruction has invalid expression. Expressions follow format:   'value {+ value}'")
-            else:
-                expr_end = self.currIndex - 1    # index for the end of the expression
-                self.valid_match('END')
-                if token == "APPEND":
-                    interpreter.do_append(expr_start, expr_end)
-                else:
-                    interpreter.do_set(expr_start, expr_end)
-
-        # LIST follows order:           list -> end
-        elif token == "LIST":
-            self.next_token()
-            self.valid_match('END')
-            interpreter.list_vars()
+    # APPEND and SET both follow order:      append/set -> id -> expression -> end
+    def append_set_statement(self):
+        token = self.currToken[0]
+        self.next_token()
+        var_name = self.currToken[1]
+        self.valid_match('ID')
 
-        # EXIT follows order:           exit -> end
-        elif token == "EXIT":
-            self.next_token()
+        # After 'ID' should be a valid expression. If not give an error, otherwise should be followed by 'END'
+        evaluated_expr = self.expression()
+        if evaluated_expr is False:
+            print("ERROR: Instruction has invalid expression. Expressions follow format:   'value {+ value}'")
+        else:
             self.valid_match('END')
-            exit()
-
-        # REVERSE follows order:        reverse -> id -> end
-        elif token == "REVERSE":
-            self.next_token()
-            self.valid_match("ID")
-            self.valid_match("END")
-            interpreter.reverse()
-
-        # Grouped the 4 print statements as have same order:    print/words/length/count -> expression -> end
-        elif 'PRINT' in token:
-            self.next_token()
-            expr_start = self.currIndex - 1
-            if self.expression() is False:
-                print("ERROR: Instruction has invalid expression. Expressions follow format:  'value {+ value}'")
+            if token == "APPEND":
+                Interpreter().do_append(var_name, evaluated_expr)
             else:
-                expr_end = self.currIndex - 1
-                self.valid_match('END')
-                interpreter.expr_print(expr_start, expr_end)
+                Interpreter().do_set(var_name, evaluated_expr)
 
-        # This runs if the lexer token/s is/are valid but don't match a valid statement type, (eg ';' by itself)
-        else:
-            values = ' '.join([token[1] for token in self.tokens])
-            print("ERROR: Invalid Input. This is not a recognised statement:    ", values)
+    # LIST follows order:           list -> end
+    def list_statement(self):
+        self.next_token()
+        self.valid_match('END')
+        Interpreter().list_vars()
 
-    # Check if from the current token to the 'END' token meets expression criteria:     value {+ value}
-    def expression(self):
-        # track amount of '+' and 'values'. Valid expressions ALWAYS have one more 'value' than '+'
-        value_count = 0
-        plus_count = 0
-
-        # check if the first token to be assessed is a value, if not then cannot be a valid expression
-        if self.isvalue():
-            value_count += 1
-            valid_expression = True
-            self.next_token()
+    # EXIT follows order:           exit -> end
+    def exit_statement(self):
+        self.next_token()
+        self.valid_match('END')
+        exit()
+
+    # REVERSE follows order:        reverse -> id -> end
+    def reverse_statement(self):
+        self.next_token()
+        var_name = self.currToken[1]
+        self.valid_match("ID")
+        self.valid_match("END")
+        Interpreter().reverse(var_name)
+
+    # Grouped the 4 print statements as have same order:    print/words/length/count -> expression -> end
+    def print_statement(self):
+        token = self.currToken[0]
+        self.next_token()
+        evaluated_expr = self.expression()
+        if evaluated_expr is False:
+            print("ERROR: Instruction has invalid expression. Expressions follow format:  'value {+ value}'")
         else:
-            valid_expression = False
+            self.valid_match('END')
+            Interpreter().expr_print(token, evaluated_expr)
 
-        # while expression follows the 'expression criteria' keep checking tokens
-        while valid_expression:
+    # This runs if the lexer token/s is/are valid but don't match a valid statement type, (eg ';' by itself)
+    def invalid_statement(self):
+        values = ' '.join([self.currToken[1]] + [token[1] for token in self.lex_tokens])
+        print("ERROR: Invalid Input. This is not a recognised statement:    ", values)
 
-            # if find an 'END' token, then a valid expression should have 1 more value than '+' tokens
-            if self.currToken[0] == "END" and (value_count - plus_count == 1):
-                valid_expression = True
-                break                   # don't consume the 'END' token, but exit the loop
+    # Check if from the current token to the 'END' token meets expression criteria:     value {+ value}
+    # The expression is evaluated at the same time by concatenating 'values'. Returns False if the expression is
+    # invalid, None if it can't be evaluated (variable doesn't exist), otherwise the evaluated string
+    def expression(self):
+        next_token = self.next_token        # local names, saves looking these up for every token
+        symbol_table = Interpreter.symbol_table
+        parts = []
+        missing_var = None
+
+        # an expression should be a value, followed by either the 'END' token or a 'PLUS' token and another value
+        while True:
+            token, value = self.currToken
+            if token not in _VALUE_TYPES:
+                return False
+
+            # collect the value of the token to be joined. Literals (most common) are checked first, constants are
+            # found in '_CONST_VAL', and ids are looked up in the symbol table
+            if token == 'LITERAL':
+                parts.append(value)
+            elif token == 'CONSTANT':
+                parts.append(_CONST_VAL[value])
             else:
-                valid_expression = False
-
-            # If the current token is a 'PLUS' token, then it should only be followed by a value
-            if self.currToken[0] == "PLUS":
-                self.next_token()
-                plus_count += 1
-
-                # If the next token is a value then repeat the loop, if not then is an invalid expression
-                if self.isvalue():
-                    valid_expression = True
-                    value_count += 1
-                    self.next_token()
-                else:
-                    valid_expression = False
-
-        return valid_expression
-
-    # helper method to see if the current token is a 'value'
-    def isvalue(self):
-        if self.currToken[0] == "ID" or self.currToken[0] == "CONSTANT" or self.currToken[0] == "LITERAL":
-            return True
-        else:
-            return False
+                id_value = symbol_table.get(value)
+                if id_value is not None:
+                    parts.append(id_value)
+                elif missing_var is None:
+                    missing_var = value     # only reported once the whole expression is known to be valid
+            next_token()
+
+            token = self.currToken[0]
+            if token == "END":
+                break                       # don't consume the 'END' token, but exit the loop
+            if token != "PLUS":
+                return False
+            next_token()
+
+        # if variable doesn't exist then can't evaluate the expression
+        if missing_var is not None:
+            print(f'ERROR: the variable {missing_var} does not exist')
+            return None
+        return ''.join(parts)
+
+    # Class variable. Dictionary of the token type that starts each statement and the method for that statement
+    statement_types = {
+        'APPEND': append_set_statement,
+        'SET': append_set_statement,
+        'LIST': list_statement,
+        'EXIT': exit_statement,
+        'REVERSE': reverse_statement,
+        **dict.fromkeys(_PRINT_TYPES, print_statement),
+    }
 
 
 # The Interpreter class used to perform the relevant statement actions.
 class Interpreter:
-    # Class variable. Allows all instances of the Interpreter class to use the same symbol table
-    symbol_table = []
-
-    # Constructor. Store the set of tokens-value tuples for current statement
-    def __init__(self, tokens):
-        self.tokens = tokens
+    # Class variable. Allows all instances of the Interpreter class to use the same symbol table. Maps name -> value
+    symbol_table = {}
 
     # Method to append an expression onto an EXISTING variable
-    def do_append(self, expr_start, expr_end):
-        # extract the variable name, evaluate the expression, and attempt to find the var in symbol table
-        id_token = self.tokens[1]       # get the second tuple as first is 'APPEND'
-        var_name = id_token[1]
-        evaluated_expr = self.eval_expression(expr_start, expr_end)
-        record = self.get_table_record(var_name)
-
+    def do_append(self, var_name, evaluated_expr):
         # if variable name is not in table or evaluated expression is invalid, give error. Else update the value
-        if record is not None:
+        if var_name in Interpreter.symbol_table:
             if evaluated_expr is not None:
-                updated_value = record[1] + evaluated_expr
-                index = Interpreter.symbol_table.index(record)
-                Interpreter.symbol_table[index] = (var_name, updated_value)
+                Interpreter.symbol_table[var_name] += evaluated_expr
         else:
             print(f'ERROR: the variable name {var_name} does not exist, append failed!')
 
     # Method to set a new variable, or override an existing one, in the symbol table
-    def do_set(self, expr_start, expr_end):
-        id_token = self.tokens[1]
-        var_name = id_token[1]
-        evaluated_expr = self.eval_expression(expr_start, expr_end)
-        record = self.get_table_record(var_name)
-
+    def do_set(self, var_name, evaluated_expr):
         # If the evaluated expression is invalid don't do anything. If the variable doesn't exists then add it,
         # otherwise update it with new expression
         if evaluated_expr is not None:
-            if record is not None:
-                index = Interpreter.symbol_table.index(record)
-                Interpreter.symbol_table[index] = (var_name, evaluated_expr)
-            else:
-                Interpreter.symbol_table.append((var_name, evaluated_expr))
-
-    # Reverse by using regex to split words at whitespace or punctuation, and update value in table
-    def reverse(self):
-        id_token = self.tokens[1]
-        var_name = id_token[1]
-        record = self.get_table_record(var_name)
-
-        if record is not None:
-            # regex will find any words (based off assignment specs) to. REMOVES NON-WORD PUNCTUATION.
-            words = re.findall(r"'?[a-zA-Z0-9]+(?:['-][a-zA-Z0-9]+)*'?", record[1])
-            reversed_value = ' '.join(words[::-1])
-            index = Interpreter.symbol_table.index(record)
-            Interpreter.symbol_table[index] = (var_name, reversed_value)
+            Interpreter.symbol_table[var_name] = evaluated_expr
+
+    # Reverse by splitting words at whitespace or punctuation, and update value in table
+    def reverse(self, var_name):
+        var_value = Interpreter.symbol_table.get(var_name)
+
+        if var_value is not None:
+            words = _split_words(var_value)
+            Interpreter.symbol_table[var_name] = ' '.join(reversed(words))
         else:
             print(f'ERROR: the variable {var_name} does not exist. Reverse failed!')
 
@@ -308,20 +347,15 @@ class Interpreter:
     def list_vars(self):
         table_count = len(Interpreter.symbol_table)
         print(f'Identifier List ({table_count}):')
-        for var_name, var_value in Interpreter.symbol_table:
+        for var_name, var_value in Interpreter.symbol_table.items():
             print(f'{var_name} : {var_value}')
 
     # Method to handle all of the print functions
-    def expr_print(self, start, end):
-        # find particular print function to use, evaluate expression, regex to split words at whitespace or punctuation
-        token = self.tokens[0]
-        token_type = token[0]
-        evaluated_expr = self.eval_expression(start, end)
+    def expr_print(self, token_type, evaluated_expr):
+        # token type is the particular print function to use, words are split at whitespace or punctuation
 
         if evaluated_expr is not None:
-            # words may start and end with a '. Words contain at least 1 alphanumeric char, and may have a - or a '
-            # between chars
-            words = re.findall(r"'?[a-zA-Z0-9]+(?:['-][a-zA-Z0-9]+)*'?", evaluated_expr)
+            words = _split_words(evaluated_expr)
             if token_type == "PRINT":
                 print(evaluated_expr)
             elif token_type == "PRINTLENGTH":
@@ -335,42 +369,6 @@ class Interpreter:
         else:
             print("Cannot print an invalid or non-exsistent expression")
 
-    # Method to find symbol table record. If record doesn't exist return None
-    def get_table_record(self, target_var):
-        for record in Interpreter.symbol_table:
-            if record[0] == target_var:
-                return record
-        return None
-
-    # Evaluate an expression by concatenating 'values' and return result
-    def eval_expression(self, start, end):
-        concat_str = ""
-
-        # loop through the tokens and concatenate their values. 'end + 1' to include end itself
-        for i in range(start, end + 1):
-            token, value = self.tokens[i]
-            if token == 'ID':
-                record = self.get_table_record(value)
-                if record is not None:
-                    id_value = record[1]       # extract the value
-                    concat_str += id_value
-                else:
-                    print(f'ERROR: the variable {value} does not exist')
-                    return None         # if variable doesn't exist then can't evaluate the expression
-            elif token == 'LITERAL':
-                concat_str += value
-            elif token == 'CONSTANT':
-                if value == 'SPACE':
-                    concat_str += ' '
-                elif value == 'TAB':
-                    concat_str += "\t"
-                else:
-                    concat_str += "\n"
-            elif token == 'PLUS':
-                continue            # ignore any 'PLUS' tokens
-
-        return concat_str
-
 
 # Main program
 def main():